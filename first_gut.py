@@ -1,14 +1,186 @@
-import numpy as np
-import hashlib
+import functools
+import threading
 
 # Computational Gut Decision System
 # Models energy dynamics with entropy, uses optimal control simulation, and outputs Yes/No.
 
-def simulate_decision(initial_energy, cost_frac, benefit_frac, risk_frac, horizon, scenarios=1000):
+# NumPy and Numba are the slowest part of start-up, so they are imported on a background thread while the
+# user types the first question (instead of before the welcome line is printed) and bound by _load_numerics().
+np = None
+prange = range          # becomes numba.prange once Numba is loaded
+_run = None             # compiled _run_impl, or None when Numba is not installed
+_numerics_ready = False
+_numerics_lock = threading.Lock()
+
+
+_BLOCK = 64  # scenarios per parallel task: 256 bytes of each noise row, a multiple of the 64-byte alignment
+
+
+def _run_impl(E, R, decays, scale, H):
+    """Evolve the YES and NO energies (rows of E) in place for H steps, both driven by the noise scale * R[t]."""
+    n = E.shape[1]
+    zero = np.float32(0.0)
+    for b in prange((n + _BLOCK - 1) // _BLOCK):  # blocks of scenarios are independent, so spread them over all cores
+        lo, hi = b * _BLOCK, min(b * _BLOCK + _BLOCK, n)
+        for t in range(H):
+            r = R[t, lo:hi]                # this step's noise is contiguous and shared by both decisions
+            for k in range(E.shape[0]):
+                factor = np.float32(1.0 - decays[k])  # keep the arithmetic in float32 like E and R
+                e_k = E[k, lo:hi]
+                for i in range(hi - lo):   # unit stride and no branches, so LLVM vectorizes it across scenarios
+                    e = e_k[i]
+                    e_next = e * factor + scale * r[i]  # decay step followed by the random fluctuation
+                    # Death is absorbing: a scenario at 0 (or killed by the action's cost) stays at 0
+                    e_k[i] = max(e_next, zero) if e > zero else zero
+
+
+def _load_numerics():
+    """Import NumPy and load the compiled kernel on first use; safe to call from several threads."""
+    global np, prange, _run, _numerics_ready
+    with _numerics_lock:
+        if _numerics_ready:
+            return
+        import numpy as np
+        try:
+            import numba
+        except ImportError:  # Numba is optional; without it the plain NumPy loop below is used
+            numba = None
+        if numba is not None:
+            prange = numba.prange
+            # Compiled eagerly for the exact argument types below and cached on disk (__pycache__), so the
+            # LLVM compile is paid once per install instead of on the first question of every session.
+            # E and R must be C-contiguous float32, decays float64, scale a float and H an int (R may have padding columns).
+            # R is (horizon, scenarios) so every step reads one contiguous row for all scenarios.
+            # nogil: other Python threads keep running during the kernel
+            _run = numba.njit("void(f4[:, ::1], f4[:, ::1], f8[::1], f4, i8)",
+                              parallel=True, fastmath=True, cache=True, nogil=True)(_run_impl)
+        _numerics_ready = True
+
+
+def _prefetch_numerics():
+    """Import NumPy/Numba ahead of first use. The kernel itself is loaded by _load_numerics on the
+    main thread: starting Numba's thread pool from another thread can hang interpreter exit."""
+    try:
+        import numba  # noqa: F401  (imports NumPy too)
+    except ImportError:
+        import numpy  # noqa: F401
+
+
+_ALIGN = 64  # bytes: one cache line, i.e. a full AVX-512 register of 16 float32 lanes
+
+
+def _aligned_empty(shape, dtype="float32"):
+    """Uninitialized C-contiguous array whose data starts on a 64-byte boundary, so SIMD loads never split lines."""
+    dtype = np.dtype(dtype)
+    nbytes = int(np.prod(shape)) * dtype.itemsize
+    raw = np.empty(nbytes + _ALIGN, dtype=np.uint8)
+    offset = -raw.ctypes.data % _ALIGN
+    return raw[offset:offset + nbytes].view(dtype).reshape(shape)
+
+
+_WORKSPACE = None  # float64 scratch for _run_numpy's closed form, grown on demand and reused across calls
+
+
+def _workspace(shape):
+    """Return a view of the shared scratch buffer with the given shape, growing the buffer if it is too small."""
+    global _WORKSPACE
+    size = int(np.prod(shape))
+    if _WORKSPACE is None or _WORKSPACE.size < size:
+        _WORKSPACE = np.empty(size)
+    return _WORKSPACE[:size].reshape(shape)
+
+
+@functools.lru_cache(maxsize=32)
+def _decay_plan(decays, H):
+    """
+    Constants _run_numpy needs for one (decays, horizon) pair, computed once and reused while questions
+    are retried with the same horizon. Returns the per-row decay factors, the closed-form weights
+    1 / factor^(t+1) (None when they would overflow and the step loop must be used) and factor^H.
+    """
+    factors = (1.0 - np.array(decays))[:, None]  # one decay factor per decision row
+    with np.errstate(over="ignore", divide="ignore"):
+        growth = factors ** -np.arange(1.0, H + 1)  # 1 / factor^(t+1) for each row and step t
+    if not (H > 0 and np.all(factors > 0) and growth[:, -1].max() < 1e150):
+        growth = None
+    return factors, growth, factors ** H
+
+
+def _run_numpy(E, R, decays, scale, H):
+    """NumPy counterpart of _run, used without Numba and for noise-free runs (R is None)."""
+    factors, growth, shrink = _decay_plan(tuple(decays), H)
+    dead = E <= 0                                # any scenario that loses all energy or more is considered dead
+    np.maximum(E, 0.0, out=E)
+
+    if R is not None:
+        R = R[:, :E.shape[1]]                    # drop the alignment padding at the end of each noise row
+
+    if growth is not None:
+        # Closed form of the recurrence: E_{t+1} = factor^(t+1) * (E_0 + scale * sum_{s<=t} R[s] / factor^(s+1)),
+        # so the whole horizon is one cumulative sum and a scenario survives iff that running sum never
+        # drops to -E_0. This replaces the per-step decay/clamp ufuncs with a multiply, a running sum and a min.
+        if R is not None:
+            # Both passes write into a reusable workspace instead of allocating two fresh (rows, H, scenarios) arrays
+            partial = _workspace((E.shape[0],) + R.shape)
+            np.multiply(R[None, :, :], scale * growth[:, :, None], out=partial)
+            # Running sum over time, one contiguous row per step (NumPy's cumsum along a middle axis is far slower)
+            for t in range(1, H):
+                np.add(partial[:, t - 1], partial[:, t], out=partial[:, t])
+            dead |= partial.min(axis=1) <= -E
+            # Stay in float64 until scaled back by factor^H: the unscaled sum can exceed the float32 range of E
+            end = partial[:, -1, :]
+            end += E
+            np.multiply(end, shrink, out=E)
+        else:
+            E *= shrink
+    else:
+        # Step-by-step fallback when the closed form would overflow (very long horizons, factor <= 0).
+        # Every scenario is updated with dense in-place ops (no boolean gather/scatter);
+        # dead ones are remembered in a mask and zeroed at the end so death stays absorbing.
+        below = np.empty(E.shape, dtype=bool)
+        step = np.empty(E.shape[1], dtype=E.dtype)
+        for t in range(H):
+            # Decay step, then the environmental random effect (one noise row shared by both decisions)
+            np.multiply(E, factors, out=E)
+            if R is not None:
+                np.multiply(R[t], scale, out=step)
+                np.add(E, step, out=E)
+            # Record scenarios that died (energy <= 0) this step and clamp energy at 0
+            np.less_equal(E, 0.0, out=below)
+            dead |= below
+            np.maximum(E, 0.0, out=E)
+    E *= ~dead
+
+
+@functools.lru_cache(maxsize=8)
+def _get_normals(initial_energy, horizon, scenarios):
+    """
+    Unit-variance float32 noise laid out (horizon, scenarios), cached across questions: row t holds every
+    scenario's noise for step t, so the simulation reads it with unit stride. Rows are padded to a multiple
+    of 16 columns so each one starts on a 64-byte boundary; only the first `scenarios` columns are meaningful.
+    The returned array is shared between calls, so callers scale it at use and never modify it.
+    Scenarios come in antithetic pairs (z and -z), which halves the number of random draws. Pairing does little
+    for the survival-rate estimate (a path-minimum indicator), so it does not stand in for more scenarios.
+    """
+    # Use a fixed seed derived from the parameters for reproducibility (same "quantum roll" for given inputs).
+    # The raw bits of the parameters feed a SeedSequence directly; the seed needs determinism, not a crypto hash,
+    # and a local PCG64 Generator is faster than the legacy global MT19937 and touches no global state.
+    seed_key = np.array([initial_energy, horizon, scenarios], dtype=np.float64)
+    rng = np.random.default_rng(np.random.SeedSequence(seed_key.view(np.uint64)))
+    half = (scenarios + 1) // 2
+    z = rng.standard_normal((half, horizon), dtype=np.float32)  # drawn per scenario, then transposed
+    noise = _aligned_empty((horizon, -(-2 * half // 16) * 16))
+    noise[:, :half] = z.T
+    np.negative(z.T, out=noise[:, half:2 * half])  # antithetic mirror of the first half
+    return noise
+
+
+def simulate_decision(initial_energy, cost_frac, benefit_frac, risk_frac, horizon, scenarios=1024):
     """
     Simulate the outcomes of taking action (YES) vs not taking action (NO) over a given time horizon.
     Returns a tuple of (survival_yes, survival_no, avg_yes, avg_no) which summarize the results.
     """
+    _load_numerics()  # no-op after the first question
+
     # Calculate immediate cost and adjusted decay rate based on benefit
     cost = initial_energy * cost_frac                     # resource cost if action is taken
     base_decay = 0.05                                     # baseline fractional energy decay per time step (5% of current energy)
@@ -17,59 +189,55 @@ def simulate_decision(initial_energy, cost_frac, benefit_frac, risk_frac, horizo
     # Set up random influences (entropy/noise) for the simulation
     # Random fluctuation per step ~ Normal(0, sigma), where sigma scales with risk and initial energy.
     rand_std = 0.1 * initial_energy * risk_frac           # volatility of environment (10% of initial_energy if risk_frac=1)
-    rand_mean = 0.0                                       # zero mean for unbiased random fluctuations
-
-    # Use a fixed seed derived from scenario parameters for reproducibility (same "quantum roll" for given inputs)
-    seed_key = f"{initial_energy}-{cost_frac}-{benefit_frac}-{risk_frac}-{horizon}"
-    seed = int(hashlib.sha256(seed_key.encode()).hexdigest(), 16) % (2**32)
-    np.random.seed(seed)
-    # Pre-generate random effects for all scenarios and time steps
-    random_matrix = np.random.normal(loc=rand_mean, scale=rand_std, size=(scenarios, horizon))
-
-    def run_scenarios(decision):
-        """Run the simulation for either taking the action (decision=True) or not (False)."""
-        E = np.full(scenarios, initial_energy, dtype=float)  # energy levels for each scenario
-        alive = np.ones(scenarios, dtype=bool)               # track which scenarios are still "alive" (energy > 0)
-
-        # Apply initial decision effects
-        decay_rate = base_decay
-        if decision:  # action taken (YES)
-            E -= cost                            # immediate cost reduces energy
-            # Any scenario that loses all energy or more is considered dead
-            dead_now = E <= 0
-            if np.any(dead_now):
-                alive[dead_now] = False
-                E[dead_now] = 0.0
-            decay_rate = effective_decay         # use reduced decay rate due to long-term benefit of action
-
-        # Simulate each time step
-        for t in range(horizon):
-            if not np.any(alive):
-                break  # no scenarios left alive, end simulation early
-            # Decay step: alive scenarios lose a fraction of their energy
-            E[alive] *= (1 - decay_rate)
-            # Random fluctuation step: add environmental random effect
-            if rand_std > 0:
-                E[alive] += random_matrix[alive, t]
-            # Check for any scenarios that died (energy <= 0) this step
-            newly_dead = (E <= 0) & alive
-            if np.any(newly_dead):
-                alive[newly_dead] = False
-                E[newly_dead] = 0.0  # clamp energy at 0 for dead scenarios
-
-        # Calculate outcome metrics
-        survival_rate = np.mean(E > 0)            # fraction of scenarios that ended with energy > 0
-        avg_final_energy = np.mean(E)             # average final energy across all scenarios
-        return survival_rate, avg_final_energy
-
-    # Run simulation for both decisions
-    surv_yes, avg_yes = run_scenarios(decision=True)   # outcomes if action is taken
-    surv_no, avg_no   = run_scenarios(decision=False)  # outcomes if action is not taken
+
+    # Pre-generated random effects for all scenarios and time steps, shared by the YES and NO runs.
+    # The unit-variance draws depend only on the energy, horizon and scenario count, so retrying a question
+    # with tweaked cost/benefit/risk reuses them; rand_std is applied inside the simulation.
+    # float32 halves the bytes streamed through the simulation (ample precision for a survival rate),
+    # and with no volatility there is nothing to draw at all.
+    random_matrix = None
+    if rand_std > 0:
+        random_matrix = _get_normals(initial_energy, horizon, scenarios)
+
+    # Skip simulations whose outcome is already known exactly:
+    #  - the immediate cost is the same in every scenario, so either all YES scenarios die on the spot or none do,
+    #    and a fatal cost leaves YES at 0% survival and 0 energy;
+    #  - an action with no cost and no benefit follows the very same trajectories as declining it;
+    #  - without volatility every scenario follows the same deterministic path, so one lane stands for all.
+    E0_yes = max(0.0, initial_energy - cost)
+    yes_is_no = E0_yes == initial_energy and effective_decay == base_decay
+    live = slice(0, 2) if E0_yes > 0.0 and not yes_is_no else slice(1, 2)
+    lanes = scenarios if random_matrix is not None else 1
+
+    # Simulate both decisions at once: row 0 takes the action (YES), row 1 declines it (NO).
+    # YES pays the immediate cost up front and uses the reduced decay rate due to the long-term benefit.
+    # Running them together streams the shared noise through the cache once instead of twice.
+    decays = np.array([effective_decay, base_decay])[live]
+    E0s = np.array([E0_yes, initial_energy], dtype=np.float32)[live]
+    E = _aligned_empty((E0s.size, lanes))  # energy levels for each decision and scenario
+    E[:] = E0s[:, None]
+
+    if _run is not None and random_matrix is not None:
+        # Compiled kernel runs the whole horizon for every scenario in one call
+        _run(E, random_matrix, decays, rand_std, horizon)
+    else:
+        _run_numpy(E, random_matrix, decays, rand_std, horizon)
+
+    # Calculate outcome metrics
+    # Dead scenarios sit at exactly 0, so counting nonzeros gives the survivors without a boolean temporary
+    survival, avg_energy = np.zeros(2), np.zeros(2)
+    survival[live] = np.count_nonzero(E, axis=1) / lanes        # fraction of scenarios that ended with energy > 0
+    avg_energy[live] = E.sum(axis=1, dtype=np.float64) / lanes  # average final energy across all scenarios
+    if yes_is_no:
+        survival[0], avg_energy[0] = survival[1], avg_energy[1]
+    surv_yes, surv_no = survival
+    avg_yes, avg_no = avg_energy
 
     return surv_yes, surv_no, avg_yes, avg_no
 
 # Main interactive loop to query the computational gut
-print("Welcome to the Computational Gut Decision System. Ask a yes/no question and provide context.")
+print("Welcome to the Computational Gut Decision System. Ask a yes/no question and provide context.", flush=True)
+threading.Thread(target=_prefetch_numerics, daemon=True).start()  # import NumPy/Numba while the user types
 while True:
     # Get the user's yes/no question or exit command
     query = input("\nEnter your decision question (or type 'quit' to exit): ")
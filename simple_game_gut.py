@@ -1,70 +1,218 @@
-import numpy as np
-import hashlib
+import functools
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
-def simulate_decision(initial_energy, cost_frac, benefit_frac, risk_frac, horizon, scenarios=1000):
+# NumPy/Numba are imported by _load_numerics() during the intro story's first pause
+np = None
+prange = range
+_run = None
+_numerics_ready = False
+_numerics_lock = threading.Lock()
+
+
+_BLOCK = 64  # scenarios per parallel task
+
+
+def _run_impl(E, R, decays, scale, H):
+    """Evolve the YES and NO energies (rows of E) in place for H steps; death (energy <= 0) is absorbing."""
+    n = E.shape[1]
+    zero = np.float32(0.0)
+    for b in prange((n + _BLOCK - 1) // _BLOCK):
+        lo, hi = b * _BLOCK, min(b * _BLOCK + _BLOCK, n)
+        for t in range(H):
+            r = R[t, lo:hi]  # contiguous noise row, shared by both decisions
+            for k in range(E.shape[0]):
+                factor = np.float32(1.0 - decays[k])
+                e_k = E[k, lo:hi]
+                for i in range(hi - lo):  # unit stride, branch-free: vectorized across scenarios
+                    e = e_k[i]
+                    e_next = e * factor + scale * r[i]
+                    e_k[i] = max(e_next, zero) if e > zero else zero
+
+
+def _load_numerics():
+    """Import NumPy and load the compiled kernel on first use; safe to call from several threads."""
+    global np, prange, _run, _numerics_ready
+    with _numerics_lock:
+        if _numerics_ready:
+            return
+        import numpy as np
+        try:
+            import numba
+        except ImportError:  # Numba is optional; without it the plain NumPy loop below is used
+            numba = None
+        if numba is not None:
+            prange = numba.prange
+            # Eager signature + on-disk cache: compiled once per install, not once per run;
+            # nogil so the game thread is not blocked while the worker simulates
+            _run = numba.njit("void(f4[:, ::1], f4[:, ::1], f8[::1], f4, i8)",
+                              parallel=True, fastmath=True, cache=True, nogil=True)(_run_impl)
+        _numerics_ready = True
+
+
+_ALIGN = 64  # bytes: a cache line / 16 float32 lanes
+
+
+def _aligned_empty(shape, dtype="float32"):
+    """Uninitialized C-contiguous array starting on a 64-byte boundary."""
+    dtype = np.dtype(dtype)
+    nbytes = int(np.prod(shape)) * dtype.itemsize
+    raw = np.empty(nbytes + _ALIGN, dtype=np.uint8)
+    offset = -raw.ctypes.data % _ALIGN
+    return raw[offset:offset + nbytes].view(dtype).reshape(shape)
+
+
+_WORKSPACE = None  # scratch for _run_numpy's closed form, reused across calls
+
+
+def _workspace(shape):
+    """Return a view of the shared scratch buffer with the given shape, growing it if needed."""
+    global _WORKSPACE
+    size = int(np.prod(shape))
+    if _WORKSPACE is None or _WORKSPACE.size < size:
+        _WORKSPACE = np.empty(size)
+    return _WORKSPACE[:size].reshape(shape)
+
+
+@functools.lru_cache(maxsize=32)
+def _decay_plan(decays, H):
+    """
+    Per-(decays, horizon) constants for _run_numpy, reused across retries: decay factors,
+    closed-form weights 1 / factor^(t+1) (None if they would overflow) and factor^H.
+    """
+    factors = (1.0 - np.array(decays))[:, None]
+    with np.errstate(over="ignore", divide="ignore"):
+        growth = factors ** -np.arange(1.0, H + 1)
+    if not (H > 0 and np.all(factors > 0) and growth[:, -1].max() < 1e150):
+        growth = None
+    return factors, growth, factors ** H
+
+
+def _run_numpy(E, R, decays, scale, H):
+    """NumPy counterpart of _run, used without Numba and for noise-free runs (R is None)."""
+    factors, growth, shrink = _decay_plan(tuple(decays), H)
+    dead = E <= 0
+    np.maximum(E, 0.0, out=E)
+
+    if R is not None:
+        R = R[:, :E.shape[1]]  # drop the alignment padding columns
+
+    if growth is not None:
+        # Closed form: E_{t+1} = factor^(t+1) * (E_0 + scale * sum_{s<=t} R[s] / factor^(s+1)),
+        # so a scenario survives iff that running sum never drops to -E_0
+        if R is not None:
+            partial = _workspace((E.shape[0],) + R.shape)
+            np.multiply(R[None, :, :], scale * growth[:, :, None], out=partial)
+            # Running sum row by row; cumsum along the middle axis is much slower
+            for t in range(1, H):
+                np.add(partial[:, t - 1], partial[:, t], out=partial[:, t])
+            dead |= partial.min(axis=1) <= -E
+            # float64 until scaled back: the unscaled sum can overflow float32
+            end = partial[:, -1, :]
+            end += E
+            np.multiply(end, shrink, out=E)
+        else:
+            E *= shrink
+    else:
+        # Step-by-step fallback where the closed form would overflow
+        below = np.empty(E.shape, dtype=bool)
+        step = np.empty(E.shape[1], dtype=E.dtype)
+        for t in range(H):
+            np.multiply(E, factors, out=E)
+            if R is not None:
+                np.multiply(R[t], scale, out=step)
+                np.add(E, step, out=E)
+            np.less_equal(E, 0.0, out=below)
+            dead |= below
+            np.maximum(E, 0.0, out=E)
+    E *= ~dead
+
+
+@functools.lru_cache(maxsize=8)
+def _get_normals(initial_energy, horizon, scenarios):
+    """
+    Unit-variance float32 noise for (horizon, scenarios), cached across questions; row t is step t for all scenarios.
+    Rows are padded to a multiple of 16 columns (64 bytes); only the first `scenarios` are used.
+    Scenarios come in antithetic pairs (z, -z), which halves the random draws.
+    The returned array is shared between calls and must not be modified.
+    """
+    # Use a fixed seed derived from the parameters for reproducibility
+    seed_key = np.array([initial_energy, horizon, scenarios], dtype=np.float64)
+    rng = np.random.default_rng(np.random.SeedSequence(seed_key.view(np.uint64)))
+    half = (scenarios + 1) // 2
+    z = rng.standard_normal((half, horizon), dtype=np.float32)
+    noise = _aligned_empty((horizon, -(-2 * half // 16) * 16))
+    noise[:, :half] = z.T
+    np.negative(z.T, out=noise[:, half:2 * half])
+    return noise
+
+
+def simulate_decision(initial_energy, cost_frac, benefit_frac, risk_frac, horizon, scenarios=1024):
     """
     Simulate the outcomes of taking action (YES) vs not taking action (NO) over a given time horizon.
     Returns a tuple of (survival_yes, survival_no, avg_yes, avg_no) which summarize the results.
     """
+    _load_numerics()
+
     cost = initial_energy * cost_frac                     # resource cost if action is taken
     base_decay = 0.05                                     # baseline fractional energy decay per time step (5%)
     effective_decay = max(0.0, base_decay * (1 - benefit_frac))  # reduced decay if action taken
 
     rand_std = 0.1 * initial_energy * risk_frac           # volatility of environment (10% of initial_energy if risk_frac=1)
-    rand_mean = 0.0
-
-    # Use a fixed seed derived from scenario parameters for reproducibility
-    seed_key = f"{initial_energy}-{cost_frac}-{benefit_frac}-{risk_frac}-{horizon}"
-    seed = int(hashlib.sha256(seed_key.encode()).hexdigest(), 16) % (2**32)
-    np.random.seed(seed)
-    random_matrix = np.random.normal(loc=rand_mean, scale=rand_std, size=(scenarios, horizon))
-
-    def run_scenarios(decision):
-        E = np.full(scenarios, initial_energy, dtype=float)
-        alive = np.ones(scenarios, dtype=bool)
-
-        # Apply initial decision effects
-        decay_rate = base_decay
-        if decision:  # action taken (YES)
-            E -= cost
-            dead_now = E <= 0
-            if np.any(dead_now):
-                alive[dead_now] = False
-                E[dead_now] = 0.0
-            decay_rate = effective_decay
-
-        for t in range(horizon):
-            if not np.any(alive):
-                break  # all scenarios dead
-            E[alive] *= (1 - decay_rate)
-            if rand_std > 0:
-                E[alive] += random_matrix[alive, t]
-            newly_dead = (E <= 0) & alive
-            if np.any(newly_dead):
-                alive[newly_dead] = False
-                E[newly_dead] = 0.0
-
-        survival_rate = np.mean(E > 0)
-        avg_final_energy = np.mean(E)
-        return survival_rate, avg_final_energy
-
-    # Run simulation for both taking the action (YES) and not taking the action (NO)
-    surv_yes, avg_yes = run_scenarios(decision=True)
-    surv_no, avg_no   = run_scenarios(decision=False)
+
+    # Unit noise is reused across retries of a question and scaled by rand_std inside the simulation;
+    # nothing to draw when the world is not volatile
+    random_matrix = None
+    if rand_std > 0:
+        random_matrix = _get_normals(initial_energy, horizon, scenarios)
+
+    # Skip simulations with a known outcome: a fatal cost makes YES 0% / 0 energy, a free action with
+    # no benefit makes YES identical to NO, and without volatility one lane stands for every scenario
+    E0_yes = max(0.0, initial_energy - cost)
+    yes_is_no = E0_yes == initial_energy and effective_decay == base_decay
+    live = slice(0, 2) if E0_yes > 0.0 and not yes_is_no else slice(1, 2)
+    lanes = scenarios if random_matrix is not None else 1
+
+    # Simulate taking the action (YES, row 0) and not taking it (NO, row 1) in one pass over the noise
+    decays = np.array([effective_decay, base_decay])[live]
+    E0s = np.array([E0_yes, initial_energy], dtype=np.float32)[live]
+    E = _aligned_empty((E0s.size, lanes))
+    E[:] = E0s[:, None]
+
+    if _run is not None and random_matrix is not None:
+        _run(E, random_matrix, decays, rand_std, horizon)
+    else:
+        _run_numpy(E, random_matrix, decays, rand_std, horizon)
+
+    # Dead scenarios are exactly 0, so nonzeros are the survivors (no boolean temporary)
+    survival, avg_energy = np.zeros(2), np.zeros(2)
+    survival[live] = np.count_nonzero(E, axis=1) / lanes
+    avg_energy[live] = E.sum(axis=1, dtype=np.float64) / lanes
+    if yes_is_no:
+        survival[0], avg_energy[0] = survival[1], avg_energy[1]
+    surv_yes, surv_no = survival
+    avg_yes, avg_no = avg_energy
 
     return surv_yes, surv_no, avg_yes, avg_no
 
 
+# Worker that runs the simulation while the game sleeps for effect
+_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+
 def play_game():
     """
     A text-based “game” version of the computational gut decision system.
     """
     print("Welcome, traveler, to the Land of Algoria!")
-    print("Here, every important choice could impact your survival and resources.\n")
+    print("Here, every important choice could impact your survival and resources.\n", flush=True)
 
-    # Game-like intro story
-    time.sleep(1)
+    # Game-like intro story; NumPy/Numba load during the first pause. This must happen on the main thread:
+    # starting Numba's thread pool from the worker below can hang interpreter exit
+    pause_end = time.monotonic() + 1
+    _load_numerics()
+    time.sleep(max(0.0, pause_end - time.monotonic()))
     print("You stand at the gates of an ancient city. A mysterious Oracle stands before you,")
     print("offering guidance on a pressing yes/no question of your choice.\n")
 
@@ -92,14 +240,16 @@ def play_game():
             print("\nThe Oracle frowns. Your answers must be numeric. Please try again.")
             continue
 
+        # Run the integrated simulation model in the background during the dramatic pause
+        initial_energy = 100.0
+        future = _EXECUTOR.submit(
+            simulate_decision, initial_energy, cost_frac, benefit_frac, risk_frac, horizon
+        )
+
         print("\nPeering through the swirling mists of time...")
         time.sleep(2)
         
-        # Run the integrated simulation model
-        initial_energy = 100.0
-        surv_yes, surv_no, avg_yes, avg_no = simulate_decision(
-            initial_energy, cost_frac, benefit_frac, risk_frac, horizon
-        )
+        surv_yes, surv_no, avg_yes, avg_no = future.result()
 
         # The Oracle's logic: 
         decision = None
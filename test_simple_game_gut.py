@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+import simple_game_gut as gut
+
+gut._load_numerics()
+
+LONG_HORIZONS = [50, 1500, 1700, 2000, 3000, 5000, 6700, 7000]
+
+
+@pytest.mark.parametrize("benefit", [0.5, 0.9])
+@pytest.mark.parametrize("horizon", LONG_HORIZONS)
+def test_numpy_path_is_finite(monkeypatch, benefit, horizon):
+    """The closed form must not overflow float32 energies into inf/NaN on long horizons."""
+    monkeypatch.setattr(gut, "_run", None)
+    result = gut.simulate_decision(100.0, 0.2, benefit, 0.3, horizon)
+    assert np.all(np.isfinite(result))
+
+
+@pytest.mark.skipif(gut._run is None, reason="Numba is not installed")
+@pytest.mark.parametrize("benefit", [0.5, 0.9])
+@pytest.mark.parametrize("horizon", LONG_HORIZONS)
+def test_numpy_path_matches_kernel(monkeypatch, benefit, horizon):
+    args = (100.0, 0.2, benefit, 0.3, horizon)
+    compiled = gut.simulate_decision(*args)
+    monkeypatch.setattr(gut, "_run", None)
+    fallback = gut.simulate_decision(*args)
+    np.testing.assert_allclose(fallback, compiled, rtol=1e-4, atol=1e-3)